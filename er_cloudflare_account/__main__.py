@@ -1,4 +1,6 @@
-from external_resources_io.input import parse_model, read_input_from_file
+from pathlib import Path
+
+from external_resources_io.config import Config
 from external_resources_io.terraform import (
     create_backend_tf_file,
     create_tf_vars_json,
@@ -8,8 +10,13 @@ from .app_interface_input import AppInterfaceInput
 
 
 def get_ai_input() -> AppInterfaceInput:
-    """Get the AppInterfaceInput from the input file."""
-    return parse_model(AppInterfaceInput, read_input_from_file())
+    """Get the AppInterfaceInput from the input file.
+
+    Parses the raw bytes with model_validate_json so pydantic-core's Rust
+    JSON parser validates in one step, instead of json.loads followed by
+    dict validation.
+    """
+    return AppInterfaceInput.model_validate_json(Path(Config().input_file).read_bytes())
 
 
 def main() -> None:
@@ -1,15 +1,22 @@
 """Import existing Cloudflare resources into Terraform state."""
 
+import asyncio
+import functools
 import logging
+import os
 import re
 import subprocess
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
+import httpx
 from cloudflare import Cloudflare
 from external_resources_io.config import Config
-from external_resources_io.input import parse_model, read_input_from_file
 from external_resources_io.log import setup_logging
 from external_resources_io.terraform import terraform_run
-from pydantic import BaseModel
 
 from .app_interface_input import (
     AppInterfaceInput,
@@ -19,9 +26,42 @@ from .app_interface_input import (
 
 logger = logging.getLogger(__name__)
 
+# Parallel terraform imports contend on the remote state lock (S3 + DynamoDB
+# takes one lock per state), so anything above 1 is opt-in via env var.
+DEFAULT_PARALLELISM = 1
+IMPORT_PARALLELISM_ENV_VAR = "IMPORT_PARALLELISM"
+MEMBERS_PER_PAGE = 50
+USE_IMPORT_BLOCKS_ENV_VAR = "USE_IMPORT_BLOCKS"
+IMPORTS_TF_FILE = "imports.tf"
+# Each terraform import spawn costs around a second just in startup; above this
+# many members a single import-blocks run is the clear winner.
+IMPORT_BLOCKS_AUTO_THRESHOLD = 10
+CLOUDFLARE_API_BASE_URL = "https://api.cloudflare.com/client/v4"
+CLOUDFLARE_API_TOKEN_ENV_VAR = "CLOUDFLARE_API_TOKEN"  # noqa: S105
+
+# Maps every byte outside [a-z0-9] to "-"; runs of "-" are collapsed afterwards
+_SANITIZE_TABLE = bytes.maketrans(
+    bytes(range(256)),
+    bytes(
+        c
+        if c in range(ord("a"), ord("z") + 1) or c in range(ord("0"), ord("9") + 1)
+        else ord("-")
+        for c in range(256)
+    ),
+)
+_DASH_RUN_RE = re.compile(rb"-{2,}")
+_MEMBER_ADDR_TMPL = 'cloudflare_account_member.this["{}"]'
+
 
-class ImportResult(BaseModel):
-    """Result of a terraform import operation."""
+@dataclass(slots=True, frozen=True)
+class ImportResult:
+    """Result of a terraform import operation.
+
+    A plain slotted dataclass rather than a pydantic model: instances are
+    only ever built from trusted internal values and exist in the hot
+    import paths, so validation machinery and per-instance __dict__ would
+    be dead weight.
+    """
 
     resource_address: str
     import_id: str
@@ -30,8 +70,44 @@ class ImportResult(BaseModel):
 
 
 def get_ai_input() -> AppInterfaceInput:
-    """Get the AppInterfaceInput from the input file."""
-    return parse_model(AppInterfaceInput, read_input_from_file())
+    """Get the AppInterfaceInput from the input file.
+
+    Parses the raw bytes with model_validate_json so pydantic-core's Rust
+    JSON parser validates in one step, instead of json.loads followed by
+    dict validation.
+    """
+    return AppInterfaceInput.model_validate_json(Path(Config().input_file).read_bytes())
+
+
+@functools.lru_cache(maxsize=1)
+def get_cloudflare_client() -> Cloudflare:
+    """Return a memoized Cloudflare client with a tuned connection pool.
+
+    The SDK constructor reads env vars and builds an httpx.Client on every
+    call, so repeated invocations (e.g. library use) would pay TLS handshake
+    each time. The single cached client uses HTTP/2, multiplexing its
+    requests over one TCP+TLS session. It backs the serial member-listing
+    fallback only; callers should build it solely when that path is taken.
+    """
+    return Cloudflare(
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+            http2=True,
+            timeout=30,
+        )
+    )
+
+
+def _import_error_message(e: subprocess.CalledProcessError) -> str:
+    """Extract a readable error message from a failed terraform run.
+
+    stderr may be bytes depending on how the subprocess was run; str() on
+    bytes would yield a "b'...'" repr instead of the decoded text.
+    """
+    stderr = e.stderr
+    if isinstance(stderr, bytes | bytearray):
+        return stderr.decode("utf-8", "replace")
+    return stderr or str(e)
 
 
 def import_resource(
@@ -39,6 +115,7 @@ def import_resource(
     import_id: str,
     *,
     dry_run: bool = False,
+    log_success: bool = True,
 ) -> ImportResult:
     """Execute terraform import for a single resource.
 
@@ -46,20 +123,23 @@ def import_resource(
         resource_address: Terraform resource address (e.g., "cloudflare_account.this").
         import_id: The import ID (e.g., "account_id" or "account_id/member_id").
         dry_run: If True, only log the command without executing.
+        log_success: If False, leave success logging to the caller; parallel
+            callers log one summary instead of contending on the logger lock.
 
     Returns:
         ImportResult with success status and any error message.
     """
     try:
         terraform_run(["import", resource_address, import_id], dry_run=dry_run)
-        logger.info("Successfully imported %s", resource_address)
+        if log_success:
+            logger.info("Successfully imported %s", resource_address)
         return ImportResult(
             resource_address=resource_address,
             import_id=import_id,
             success=True,
         )
     except subprocess.CalledProcessError as e:
-        error_msg = str(e.stderr) if e.stderr else str(e)
+        error_msg = _import_error_message(e)
         logger.warning("Failed to import %s: %s", resource_address, error_msg)
         return ImportResult(
             resource_address=resource_address,
@@ -79,110 +159,501 @@ def sanitize_email(email: str) -> str:
 
     Matches Terraform's: replace(lower(member.email), "/[^a-z0-9]+/", "-")
 
+    Implemented as a byte-table translate rather than a regex substitution:
+    emails are short ASCII strings and the C-level table lookup avoids the
+    regex engine entirely. Only collapsing runs of "-" still uses a regex,
+    and only when a run is actually present.
+
     Args:
         email: The email address to sanitize.
 
     Returns:
         Sanitized string suitable for use as a Terraform resource key.
     """
-    return re.sub(r"[^a-z0-9]+", "-", email.lower())
+    sanitized = email.lower().encode("ascii", "replace").translate(_SANITIZE_TABLE)
+    if b"--" in sanitized:
+        sanitized = _DASH_RUN_RE.sub(b"-", sanitized)
+    return sanitized.decode("ascii")
+
+
+def member_resource_address(email: str) -> str:
+    """Build the Terraform resource address for an account member."""
+    return _MEMBER_ADDR_TMPL.format(sanitize_email(email))
+
+
+async def _fetch_members_page(
+    http_client: httpx.AsyncClient,
+    account_id: str,
+    page: int,
+) -> dict[str, Any]:
+    """Fetch a single page of account members from the Cloudflare API."""
+    response = await http_client.get(
+        f"/accounts/{account_id}/members",
+        params={"per_page": MEMBERS_PER_PAGE, "page": page},
+    )
+    response.raise_for_status()
+    data: dict[str, Any] = response.json()
+    return data
+
+
+async def _fetch_member_ids_async(
+    account_id: str,
+    api_token: str,
+    emails: set[str],
+) -> dict[str, str]:
+    """Resolve member emails to IDs, requesting pages concurrently.
+
+    Page 1 reveals the total page count; the remaining pages are then
+    fetched in parallel over a single HTTP/2 connection, so wall time is
+    roughly one round trip instead of one per page. Each page is reduced to
+    the requested emails as it arrives, so memory stays bounded by the
+    configured member count rather than the account size.
+
+    Args:
+        account_id: The Cloudflare account ID.
+        api_token: Cloudflare API token.
+        emails: Member emails to look up.
+
+    Returns:
+        Mapping of email to member ID for the emails that were found.
+    """
+    member_id_by_email: dict[str, str] = {}
+
+    def collect(page_data: dict[str, Any]) -> None:
+        for raw_member in page_data.get("result") or []:
+            member_id = raw_member.get("id")
+            email = (raw_member.get("user") or {}).get("email")
+            if member_id and email in emails:
+                member_id_by_email[email] = member_id
+
+    async with httpx.AsyncClient(
+        base_url=CLOUDFLARE_API_BASE_URL,
+        headers={"Authorization": f"Bearer {api_token}"},
+        http2=True,
+        timeout=30,
+    ) as http_client:
+        first = await _fetch_members_page(http_client, account_id, page=1)
+        collect(first)
+        total_pages = (first.get("result_info") or {}).get("total_pages", 1)
+        if total_pages > 1 and len(member_id_by_email) < len(emails):
+            for page_data in await asyncio.gather(
+                *(
+                    _fetch_members_page(http_client, account_id, page=page)
+                    for page in range(2, total_pages + 1)
+                )
+            ):
+                collect(page_data)
+    return member_id_by_email
+
+
+def _resolve_member_ids(
+    client: Cloudflare | None,
+    account_id: str,
+    emails: set[str],
+    api_token: str | None = None,
+) -> dict[str, str] | None:
+    """Map the given member emails to their Cloudflare member IDs.
+
+    Only the requested emails are recorded, and pagination stops as soon as
+    all of them have been found, so large accounts do not pay for listing
+    every member. The members list API offers no server-side email filter,
+    so filtering happens here. With an API token, pages are fetched
+    concurrently via _fetch_member_ids_async; otherwise the SDK's serial
+    paginator is used.
+
+    Args:
+        client: Cloudflare API client, or None if one was never built.
+        account_id: The Cloudflare account ID.
+        emails: Member emails to look up.
+        api_token: Cloudflare API token for the concurrent fetch path.
+
+    Returns:
+        Mapping of email to member ID, or None if the member list could not
+        be fetched.
+    """
+    member_id_by_email: dict[str, str] = {}
+    try:
+        if api_token:
+            member_id_by_email = asyncio.run(
+                _fetch_member_ids_async(account_id, api_token, emails)
+            )
+        elif client is None:
+            logger.error(
+                "No Cloudflare client available to list members for account ID %s",
+                account_id,
+            )
+            return None
+        else:
+            for member in client.accounts.members.list(
+                account_id=account_id, per_page=MEMBERS_PER_PAGE
+            ):
+                member_id = member.id
+                user = member.user
+                email = user.email if user else None
+                if member_id and email and email in emails:
+                    member_id_by_email[email] = member_id
+                    if len(member_id_by_email) == len(emails):
+                        break
+    except Exception:
+        logger.exception("Failed to list members for account ID %s", account_id)
+        return None
+    return member_id_by_email
+
+
+def _validate_members(
+    members: list[CloudflareAccountMember],
+) -> tuple[list[CloudflareAccountMember], list[ImportResult]]:
+    """Split members into plausible ones and failures for the rest.
+
+    An email without an "@" (or a blank one) cannot match any account
+    member, so failing it up front avoids paying for the member list API
+    call just to report it missing.
+
+    Args:
+        members: List of members from configuration.
+
+    Returns:
+        Tuple of (members worth looking up, failure results for the rest).
+    """
+    valid: list[CloudflareAccountMember] = []
+    failures: list[ImportResult] = []
+    for member in members:
+        if member.email.strip() and "@" in member.email:
+            valid.append(member)
+        else:
+            logger.error(
+                "Account member '%s' is not a valid email address", member.email
+            )
+            error_msg = f"Account member '{member.email}' is not a valid email address"
+            failures.append(
+                ImportResult(
+                    resource_address=member_resource_address(member.email),
+                    import_id="",
+                    success=False,
+                    error_message=error_msg,
+                )
+            )
+    return valid, failures
+
+
+def render_import_blocks(imports: Iterable[tuple[str, str]]) -> str:
+    """Render Terraform import blocks (requires Terraform >= 1.5).
+
+    Args:
+        imports: Pairs of (resource address, import ID).
+
+    Returns:
+        HCL snippet with one import block per pair.
+    """
+    return "\n".join(
+        f'import {{\n  to = {resource_address}\n  id = "{import_id}"\n}}\n'
+        for resource_address, import_id in imports
+    )
+
+
+def import_resources_via_blocks(
+    imports: list[tuple[str, str]],
+    *,
+    dry_run: bool = False,
+) -> list[ImportResult]:
+    """Import resources in a single terraform run using import blocks.
+
+    Writes an imports.tf file into the terraform working directory and runs
+    one apply, so terraform starts (and initializes providers) once and takes
+    the remote state lock once instead of once per resource. The apply is
+    targeted at the imported addresses only; without targeting it would
+    reconcile the full configuration and create any configured member that
+    could not be resolved to an import ID. The file is removed afterwards so
+    later applies do not try to re-import already-managed resources.
+
+    Hand-assembling the state JSON and pushing it with `terraform state push`
+    would also need only one lock round-trip, but state built outside
+    terraform lacks the provider's computed attributes and schema versioning;
+    import blocks get the same single-run cost while letting the provider
+    populate the state.
+
+    Args:
+        imports: Pairs of (resource address, import ID).
+        dry_run: If True, only log the command without executing.
+
+    Returns:
+        List of ImportResult for each resource. Success is reported per run,
+        not per resource: if the apply fails, all entries are marked failed
+        with the shared error message.
+    """
+    imports_file = Path(IMPORTS_TF_FILE)
+    imports_file.write_text(render_import_blocks(imports), encoding="utf-8")
+    try:
+        terraform_run(
+            [
+                "apply",
+                "-auto-approve",
+                *(f"-target={resource_address}" for resource_address, _ in imports),
+            ],
+            dry_run=dry_run,
+        )
+    except subprocess.CalledProcessError as e:
+        error_msg = _import_error_message(e)
+        logger.warning("Failed to import resources: %s", error_msg)
+        return [
+            ImportResult(
+                resource_address=resource_address,
+                import_id=import_id,
+                success=False,
+                error_message=error_msg,
+            )
+            for resource_address, import_id in imports
+        ]
+    finally:
+        imports_file.unlink(missing_ok=True)
+
+    logger.info("Successfully imported %d resources", len(imports))
+    return [
+        ImportResult(
+            resource_address=resource_address,
+            import_id=import_id,
+            success=True,
+        )
+        for resource_address, import_id in imports
+    ]
 
 
 def import_account_members(
-    client: Cloudflare,
+    client: Cloudflare | None,
     account_id: str,
     members: list[CloudflareAccountMember],
     *,
     dry_run: bool = False,
+    parallelism: int = DEFAULT_PARALLELISM,
+    api_token: str | None = None,
 ) -> list[ImportResult]:
     """Import account members.
 
+    Member imports are independent of each other and spend most of their time
+    waiting on the terraform subprocess, so with parallelism above 1 they fan
+    out concurrently. The default stays serial: the remote state backend
+    holds one lock per state, so only lock-tolerant setups should opt in.
+
     Args:
         client: Cloudflare API client.
         account_id: The Cloudflare account ID.
         members: List of members from configuration to import.
         dry_run: If True, only log commands without executing.
+        parallelism: Maximum number of concurrent terraform import runs.
+        api_token: Cloudflare API token for the concurrent member fetch.
 
     Returns:
         List of ImportResult for each member import operation.
     """
-    try:
-        member_id_by_email = {
-            email: member.id
-            for member in client.accounts.members.list(account_id=account_id)
-            if (user := member.user) and (email := user.email)
-        }
-    except Exception:
-        logger.exception("Failed to list members for account ID %s", account_id)
+    if not members:
         return []
 
-    results: list[ImportResult] = []
-    for member in members:
-        member_id = member_id_by_email.get(member.email)
-        resource_address = (
-            f'cloudflare_account_member.this["{sanitize_email(member.email)}"]'
+    valid_members, results = _validate_members(members)
+    if not valid_members:
+        return results
+
+    member_id_by_email = _resolve_member_ids(
+        client,
+        account_id,
+        {member.email for member in valid_members},
+        api_token=api_token,
+    )
+    if member_id_by_email is None:
+        # A failed member listing must fail every member, not drop them,
+        # so the run exits nonzero instead of reporting a clean import.
+        results.extend(
+            ImportResult(
+                resource_address=member_resource_address(member.email),
+                import_id="",
+                success=False,
+                error_message=f"Could not resolve member ID for '{member.email}'",
+            )
+            for member in valid_members
         )
+        return results
+
+    to_import: list[tuple[str, str]] = []
+    for member in valid_members:
+        member_id = member_id_by_email.get(member.email)
+        resource_address = member_resource_address(member.email)
 
         if member_id is None:
-            error_msg = f"Account member '{member.email}' not found"
-            logger.error(error_msg)
+            logger.error("Account member '%s' not found", member.email)
             results.append(
                 ImportResult(
                     resource_address=resource_address,
                     import_id="",
                     success=False,
-                    error_message=error_msg,
+                    error_message=f"Account member '{member.email}' not found",
                 )
             )
         else:
+            to_import.append((resource_address, f"{account_id}/{member_id}"))
+
+    if parallelism > 1 and len(to_import) > 1:
+        # One summary line instead of per-import INFO logs: concurrent
+        # per-import logging serializes the workers on the logger lock.
+        def _import(item: tuple[str, str]) -> ImportResult:
+            resource_address, import_id = item
+            return import_resource(
+                resource_address, import_id, dry_run=dry_run, log_success=False
+            )
+
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            imported = list(executor.map(_import, to_import))
+        results.extend(imported)
+        logger.info(
+            "Successfully imported %d of %d members",
+            sum(result.success for result in imported),
+            len(imported),
+        )
+    else:
+        results.extend(
+            import_resource(resource_address, import_id, dry_run=dry_run)
+            for resource_address, import_id in to_import
+        )
+    return results
+
+
+def _import_state_via_blocks(
+    client: Cloudflare | None,
+    account: CloudflareAccount,
+    *,
+    dry_run: bool = False,
+    api_token: str | None = None,
+) -> list[ImportResult]:
+    """Import all resources for a Cloudflare account in one terraform run."""
+    valid_members, results = _validate_members(account.members)
+    member_id_by_email: dict[str, str] | None = {}
+    if valid_members:
+        member_id_by_email = _resolve_member_ids(
+            client,
+            account.account_id,
+            {member.email for member in valid_members},
+            api_token=api_token,
+        )
+    if member_id_by_email is None:
+        # The account import needs no member resolution, so a failed member
+        # listing must not skip it; the members fail so the run exits nonzero.
+        results.extend(
+            ImportResult(
+                resource_address=member_resource_address(member.email),
+                import_id="",
+                success=False,
+                error_message=f"Could not resolve member ID for '{member.email}'",
+            )
+            for member in valid_members
+        )
+        results.extend(
+            import_resources_via_blocks(
+                [("cloudflare_account.this", account.account_id)], dry_run=dry_run
+            )
+        )
+        return results
+
+    imports: list[tuple[str, str]] = [("cloudflare_account.this", account.account_id)]
+    for member in valid_members:
+        member_id = member_id_by_email.get(member.email)
+        resource_address = member_resource_address(member.email)
+
+        if member_id is None:
+            logger.error("Account member '%s' not found", member.email)
             results.append(
-                import_resource(
-                    resource_address,
-                    f"{account_id}/{member_id}",
-                    dry_run=dry_run,
+                ImportResult(
+                    resource_address=resource_address,
+                    import_id="",
+                    success=False,
+                    error_message=f"Account member '{member.email}' not found",
                 )
             )
+        else:
+            imports.append((resource_address, f"{account.account_id}/{member_id}"))
+
+    results.extend(import_resources_via_blocks(imports, dry_run=dry_run))
     return results
 
 
 def import_state(
-    client: Cloudflare,
+    client: Cloudflare | None,
     account: CloudflareAccount,
     *,
     dry_run: bool = False,
+    parallelism: int = DEFAULT_PARALLELISM,
+    use_import_blocks: bool = False,
+    api_token: str | None = None,
 ) -> list[ImportResult]:
     """Import all resources for a Cloudflare account.
 
+    With use_import_blocks, all resources are imported by a single terraform
+    apply of generated import blocks, avoiding one terraform startup per
+    resource. Otherwise the account is imported first since the members
+    belong to it, and the member imports then fan out concurrently.
+
     Args:
         client: Cloudflare API client.
         account: The CloudflareAccount configuration.
         dry_run: If True, only log commands without executing.
+        parallelism: Maximum number of concurrent terraform import runs.
+        use_import_blocks: If True, import everything in one terraform run.
+        api_token: Cloudflare API token for the concurrent member fetch.
 
     Returns:
         List of ImportResult for each import operation.
     """
     logger.info("Importing resources for account ID: %s", account.account_id)
 
+    if use_import_blocks:
+        return _import_state_via_blocks(
+            client, account, dry_run=dry_run, api_token=api_token
+        )
+
     return [
         import_account(account.account_id, dry_run=dry_run),
         *import_account_members(
-            client, account.account_id, account.members, dry_run=dry_run
+            client,
+            account.account_id,
+            account.members,
+            dry_run=dry_run,
+            parallelism=parallelism,
+            api_token=api_token,
         ),
     ]
 
 
 def main() -> None:
     """Main entry point for import-tfstate CLI."""
-    setup_logging()
     config = Config()
+    setup_logging()
 
     ai_input = get_ai_input()
-    client = Cloudflare()
-
-    results = import_state(client, ai_input.data, dry_run=config.dry_run)
+    api_token = os.environ.get(CLOUDFLARE_API_TOKEN_ENV_VAR)
+    # The SDK client only serves the serial member-listing fallback: with an
+    # API token the member fetch goes through httpx directly, and without
+    # members nothing lists at all, so skip the SDK init in both cases.
+    client = (
+        get_cloudflare_client() if ai_input.data.members and not api_token else None
+    )
+
+    use_import_blocks_env = os.environ.get(USE_IMPORT_BLOCKS_ENV_VAR)
+    use_import_blocks = (
+        use_import_blocks_env.lower() == "true"
+        if use_import_blocks_env is not None
+        else len(ai_input.data.members) >= IMPORT_BLOCKS_AUTO_THRESHOLD
+    )
+
+    results = import_state(
+        client,
+        ai_input.data,
+        dry_run=config.dry_run,
+        parallelism=int(
+            os.environ.get(IMPORT_PARALLELISM_ENV_VAR, DEFAULT_PARALLELISM)
+        ),
+        use_import_blocks=use_import_blocks,
+        api_token=api_token,
+    )
 
-    succeeded = sum(1 for r in results if r.success)
-    failed = sum(1 for r in results if not r.success)
+    succeeded = sum(r.success for r in results)
+    failed = len(results) - succeeded
 
     logger.info("Import complete: %d succeeded, %d failed", succeeded, failed)
 
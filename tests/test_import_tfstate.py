@@ -1,14 +1,18 @@
 """Tests for import_tfstate module."""
 
+import json
 import subprocess
-from collections.abc import Iterator
-from unittest.mock import MagicMock, call, create_autospec, patch
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, call, create_autospec, patch
 
 import pytest
 from cloudflare.types.shared.member import Member, User
 
 from er_cloudflare_account.import_tfstate import (
+    get_cloudflare_client,
     main,
+    render_import_blocks,
     sanitize_email,
 )
 
@@ -65,17 +69,26 @@ def create_mock_member(member_id: str, email: str) -> MagicMock:
 
 
 @pytest.fixture
-def mock_read_input() -> Iterator[MagicMock]:
-    """Mock read_input_from_file."""
-    with patch("er_cloudflare_account.import_tfstate.read_input_from_file") as mock:
-        yield mock
+def set_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[dict], None]:
+    """Provide a setter that writes input data to a temporary INPUT_FILE."""
+
+    def _set_input(data: dict) -> None:
+        input_file = tmp_path / "input.json"
+        input_file.write_text(json.dumps(data), encoding="utf-8")
+        monkeypatch.setenv("INPUT_FILE", str(input_file))
+
+    return _set_input
 
 
 @pytest.fixture
 def mock_cloudflare() -> Iterator[MagicMock]:
-    """Mock Cloudflare client."""
+    """Mock Cloudflare client, keeping the memoized client out of the cache."""
+    get_cloudflare_client.cache_clear()
     with patch("er_cloudflare_account.import_tfstate.Cloudflare") as mock:
         yield mock
+    get_cloudflare_client.cache_clear()
 
 
 @pytest.fixture
@@ -85,6 +98,12 @@ def mock_terraform_run() -> Iterator[MagicMock]:
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def no_api_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure tests use the mocked SDK client, not the direct API path."""
+    monkeypatch.delenv("CLOUDFLARE_API_TOKEN", raising=False)
+
+
 @pytest.fixture(autouse=True)
 def mock_logger() -> Iterator[MagicMock]:
     """Mock logger to suppress log output in tests."""
@@ -106,11 +125,11 @@ def test_import_account_only(
     mock_non_dry_run: None,  # noqa: ARG001
     mock_terraform_run: MagicMock,
     mock_cloudflare: MagicMock,
-    mock_read_input: MagicMock,
+    set_input: Callable[[dict], None],
 ) -> None:
     """Test importing account without members."""
-    mock_read_input.return_value = build_input_data()
-    setup_cloudflare_client(mock_cloudflare)
+    set_input(build_input_data())
+    mock_client = setup_cloudflare_client(mock_cloudflare)
 
     main()
 
@@ -119,19 +138,23 @@ def test_import_account_only(
         ["import", "cloudflare_account.this", "acct-123"],
         dry_run=False,
     )
+    # No members configured, so the member list must not be fetched at all
+    mock_client.accounts.members.list.assert_not_called()
 
 
 def test_import_account_with_members(
     mock_non_dry_run: None,  # noqa: ARG001
     mock_terraform_run: MagicMock,
     mock_cloudflare: MagicMock,
-    mock_read_input: MagicMock,
+    set_input: Callable[[dict], None],
 ) -> None:
     """Test importing account with members."""
-    mock_read_input.return_value = build_input_data(
-        members=[
-            {"email": "user@example.com", "roles": ["Administrator Read Only"]},
-        ]
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "user@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
     )
 
     mock_member = create_mock_member("member-456", "user@example.com")
@@ -152,18 +175,330 @@ def test_import_account_with_members(
     ])
 
 
-def test_member_not_found_fails(
+@pytest.mark.parametrize("parallelism", [None, "4"])
+def test_import_account_with_multiple_members(
     mock_non_dry_run: None,  # noqa: ARG001
     mock_terraform_run: MagicMock,
     mock_cloudflare: MagicMock,
-    mock_read_input: MagicMock,
+    set_input: Callable[[dict], None],
+    monkeypatch: pytest.MonkeyPatch,
+    parallelism: str | None,
 ) -> None:
-    """Test member in config but not in Cloudflare causes failure."""
-    mock_read_input.return_value = build_input_data(
+    """Test multiple member imports complete, serially and in parallel."""
+    if parallelism is not None:
+        monkeypatch.setenv("IMPORT_PARALLELISM", parallelism)
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "alice@example.com", "roles": ["Administrator Read Only"]},
+                {"email": "bob@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+
+    setup_cloudflare_client(
+        mock_cloudflare,
         members=[
-            {"email": "missing@example.com", "roles": ["Administrator Read Only"]},
+            create_mock_member("member-1", "alice@example.com"),
+            create_mock_member("member-2", "bob@example.com"),
+        ],
+    )
+
+    main()
+
+    assert mock_terraform_run.call_count == 3  # noqa: PLR2004
+    mock_terraform_run.assert_any_call(
+        [
+            "import",
+            'cloudflare_account_member.this["alice-example-com"]',
+            "acct-123/member-1",
+        ],
+        dry_run=False,
+    )
+    mock_terraform_run.assert_any_call(
+        [
+            "import",
+            'cloudflare_account_member.this["bob-example-com"]',
+            "acct-123/member-2",
+        ],
+        dry_run=False,
+    )
+
+
+def test_member_lookup_stops_early(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,  # noqa: ARG001
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+) -> None:
+    """Test the member listing stops once all configured emails are found."""
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "user@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+
+    consumed: list[MagicMock] = []
+
+    def members_pages() -> Iterator[MagicMock]:
+        for mock_member in [
+            create_mock_member("member-1", "user@example.com"),
+            create_mock_member("member-2", "other@example.com"),
+            create_mock_member("member-3", "another@example.com"),
+        ]:
+            consumed.append(mock_member)
+            yield mock_member
+
+    mock_client = mock_cloudflare.return_value
+    mock_client.accounts.members.list.return_value = members_pages()
+
+    main()
+
+    mock_client.accounts.members.list.assert_called_once_with(
+        account_id="acct-123", per_page=50
+    )
+    # Only the first member should have been consumed from the paginator
+    assert len(consumed) == 1
+
+
+def build_members_page_response(
+    members: list[dict],
+    *,
+    total_pages: int = 1,
+) -> MagicMock:
+    """Build a mock httpx response for a members list page."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "result": members,
+        "result_info": {"total_pages": total_pages},
+    }
+    return mock_response
+
+
+def test_members_fetched_concurrently_with_api_token(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the direct API path is used when an API token is available."""
+    monkeypatch.setenv("CLOUDFLARE_API_TOKEN", "test-token")
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "alice@example.com", "roles": ["Administrator Read Only"]},
+                {"email": "bob@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+    mock_client = setup_cloudflare_client(mock_cloudflare)
+
+    mock_http = MagicMock()
+    mock_http.get = AsyncMock(
+        side_effect=[
+            build_members_page_response(
+                [{"id": "member-1", "user": {"email": "alice@example.com"}}],
+                total_pages=2,
+            ),
+            build_members_page_response([
+                {"id": "member-2", "user": {"email": "bob@example.com"}}
+            ]),
         ]
     )
+
+    with patch("er_cloudflare_account.import_tfstate.httpx.AsyncClient") as mock_async:
+        mock_async.return_value.__aenter__ = AsyncMock(return_value=mock_http)
+        mock_async.return_value.__aexit__ = AsyncMock(return_value=False)
+        main()
+
+    assert mock_http.get.call_count == 2  # noqa: PLR2004
+    mock_client.accounts.members.list.assert_not_called()
+    assert mock_terraform_run.call_count == 3  # noqa: PLR2004
+    mock_terraform_run.assert_any_call(
+        [
+            "import",
+            'cloudflare_account_member.this["bob-example-com"]',
+            "acct-123/member-2",
+        ],
+        dry_run=False,
+    )
+
+
+def test_import_blocks_single_terraform_run(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test USE_IMPORT_BLOCKS imports everything in one terraform apply."""
+    monkeypatch.setenv("USE_IMPORT_BLOCKS", "True")
+    monkeypatch.chdir(tmp_path)
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "user@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+
+    mock_member = create_mock_member("member-456", "user@example.com")
+    setup_cloudflare_client(mock_cloudflare, members=[mock_member])
+
+    main()
+
+    assert mock_terraform_run.call_count == 1
+    mock_terraform_run.assert_called_with(
+        [
+            "apply",
+            "-auto-approve",
+            "-target=cloudflare_account.this",
+            '-target=cloudflare_account_member.this["user-example-com"]',
+        ],
+        dry_run=False,
+    )
+    # The generated imports.tf must not leak into later terraform runs
+    assert not (tmp_path / "imports.tf").exists()
+
+
+def test_import_blocks_member_listing_failure_still_imports_account(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test a failed member listing imports the account and exits nonzero."""
+    monkeypatch.setenv("USE_IMPORT_BLOCKS", "True")
+    monkeypatch.chdir(tmp_path)
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "user@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+
+    mock_client = mock_cloudflare.return_value
+    mock_client.accounts.members.list.side_effect = Exception("API error")
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    assert mock_terraform_run.call_count == 1
+    mock_terraform_run.assert_called_with(
+        ["apply", "-auto-approve", "-target=cloudflare_account.this"],
+        dry_run=False,
+    )
+
+
+def test_import_blocks_chosen_automatically_for_many_members(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test the import-blocks path kicks in at the member threshold."""
+    monkeypatch.delenv("USE_IMPORT_BLOCKS", raising=False)
+    monkeypatch.chdir(tmp_path)
+    emails = [f"user{i}@example.com" for i in range(10)]
+    set_input(
+        build_input_data(
+            members=[
+                {"email": email, "roles": ["Administrator Read Only"]}
+                for email in emails
+            ]
+        )
+    )
+    setup_cloudflare_client(
+        mock_cloudflare,
+        members=[
+            create_mock_member(f"member-{i}", email) for i, email in enumerate(emails)
+        ],
+    )
+
+    main()
+
+    assert mock_terraform_run.call_count == 1
+    mock_terraform_run.assert_called_with(
+        [
+            "apply",
+            "-auto-approve",
+            "-target=cloudflare_account.this",
+            *(
+                f'-target=cloudflare_account_member.this["user{i}-example-com"]'
+                for i in range(10)
+            ),
+        ],
+        dry_run=False,
+    )
+
+
+def test_render_import_blocks() -> None:
+    """Test import block rendering."""
+    assert render_import_blocks([
+        ("cloudflare_account.this", "acct-123"),
+        ('cloudflare_account_member.this["user-example-com"]', "acct-123/member-456"),
+    ]) == (
+        "import {\n"
+        "  to = cloudflare_account.this\n"
+        '  id = "acct-123"\n'
+        "}\n"
+        "\n"
+        "import {\n"
+        '  to = cloudflare_account_member.this["user-example-com"]\n'
+        '  id = "acct-123/member-456"\n'
+        "}\n"
+    )
+
+
+def test_invalid_member_email_fails_without_api_call(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+) -> None:
+    """Test an obviously invalid email fails without listing members."""
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "not-an-email", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+    mock_client = setup_cloudflare_client(mock_cloudflare)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    mock_client.accounts.members.list.assert_not_called()
+    # Account import should still be attempted
+    assert mock_terraform_run.call_count == 1
+
+
+def test_member_not_found_fails(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+) -> None:
+    """Test member in config but not in Cloudflare causes failure."""
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "missing@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
     setup_cloudflare_client(mock_cloudflare)
 
     with pytest.raises(SystemExit) as exc_info:
@@ -174,14 +509,44 @@ def test_member_not_found_fails(
     assert mock_terraform_run.call_count == 1
 
 
+def test_member_listing_failure_exits_with_error(
+    mock_non_dry_run: None,  # noqa: ARG001
+    mock_terraform_run: MagicMock,
+    mock_cloudflare: MagicMock,
+    set_input: Callable[[dict], None],
+) -> None:
+    """Test a failed member listing fails the members and exits nonzero."""
+    set_input(
+        build_input_data(
+            members=[
+                {"email": "user@example.com", "roles": ["Administrator Read Only"]},
+            ]
+        )
+    )
+
+    mock_client = mock_cloudflare.return_value
+    mock_client.accounts.members.list.side_effect = Exception("API error")
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    # Account import should still be attempted, member imports must not run
+    assert mock_terraform_run.call_count == 1
+    mock_terraform_run.assert_called_with(
+        ["import", "cloudflare_account.this", "acct-123"],
+        dry_run=False,
+    )
+
+
 def test_import_failure_exits_with_error(
     mock_non_dry_run: None,  # noqa: ARG001
     mock_terraform_run: MagicMock,
     mock_cloudflare: MagicMock,
-    mock_read_input: MagicMock,
+    set_input: Callable[[dict], None],
 ) -> None:
     """Test main exits with code 1 when terraform import fails."""
-    mock_read_input.return_value = build_input_data()
+    set_input(build_input_data())
     setup_cloudflare_client(mock_cloudflare)
     mock_terraform_run.side_effect = subprocess.CalledProcessError(
         returncode=1, cmd=["terraform", "import"]
@@ -197,10 +562,10 @@ def test_dry_run_flag(
     mock_dry_run: None,  # noqa: ARG001
     mock_terraform_run: MagicMock,
     mock_cloudflare: MagicMock,
-    mock_read_input: MagicMock,
+    set_input: Callable[[dict], None],
 ) -> None:
     """Test dry_run config is passed to terraform_run."""
-    mock_read_input.return_value = build_input_data()
+    set_input(build_input_data())
     setup_cloudflare_client(mock_cloudflare)
 
     main()
@@ -218,6 +583,7 @@ def test_dry_run_flag(
         ("User.Name+tag@Example.COM", "user-name-tag-example-com"),
         ("test123@domain.org", "test123-domain-org"),
         ("a..b@@c..d", "a-b-c-d"),
+        ("üser@exämple.com", "-ser-ex-mple-com"),
     ],
 )
 def test_sanitize_email(email: str, expected: str) -> None:
@@ -1,5 +1,5 @@
-from collections.abc import Iterator
-from unittest.mock import MagicMock, patch
+import json
+from pathlib import Path
 
 import pytest
 
@@ -7,20 +7,16 @@ from er_cloudflare_account.__main__ import get_ai_input  # noqa: PLC2701
 from er_cloudflare_account.app_interface_input import AppInterfaceInput
 
 
-@pytest.fixture
-def mock_read_input_from_file() -> Iterator[MagicMock]:
-    """Patch read_input_from_file"""
-    with patch("er_cloudflare_account.__main__.read_input_from_file") as m:
-        yield m
-
-
 def test_main_get_ai_input(
     ai_input: AppInterfaceInput,
     raw_input_data: dict,
-    mock_read_input_from_file: MagicMock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test get_ai_input"""
-    mock_read_input_from_file.return_value = raw_input_data
+    input_file = tmp_path / "input.json"
+    input_file.write_text(json.dumps(raw_input_data), encoding="utf-8")
+    monkeypatch.setenv("INPUT_FILE", str(input_file))
 
     main_ai_input = get_ai_input()
 